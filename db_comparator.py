@@ -7,29 +7,171 @@ Feature added -
     2. Added a detailed differences table that lists all tables with differences, the type of difference (schema, row count, data), and specific details about the differences for quick reference.
 """
 
+import argparse
+import hashlib
+import io
+import os
 import sqlite3
+import struct
 import sys
+import threading
 import tkinter as tk
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
+from itertools import chain, islice, repeat
 from pathlib import Path
 from tkinter import filedialog
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Literal, Optional, Set, Tuple
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 from rich.prompt import Confirm, Prompt
 
+try:
+    import xxhash  # optional, faster row hashing
+except ImportError:
+    xxhash = None
+
+# Number of rows fetched per round trip when streaming table data
+FETCH_BATCH_SIZE = 1024
+
+# Below this many rows per side, a plain list scan beats building hash tables
+SMALL_TABLE_ROWS = 128
+
+# Page cache (in KiB) and memory-mapped I/O window per database on a connection
+CACHE_SIZE_KIB = 262144  # 256 MiB
+MMAP_SIZE = 1 << 30  # 1 GiB
+STATEMENT_CACHE_SIZE = 256  # prepared statements kept per connection
+
 def gen(text: str, style: str):
     """This program is used to generate strings to print in sytl
     Eg - print_(gen("Error occured :( , failure not found!", 'bold #ff471a'))"""
     output = "[{}]{}[/{}]".format(style, text, style)
     return output
 
-@dataclass
+def _identity(value: Any) -> Any:
+    """Return a value unchanged."""
+    return value
+
+def _round_float(value: float) -> float:
+    """Round a float to avoid precision issues."""
+    return round(value, 10)
+
+# Normalizer per Python type of a stored value (SQLite only yields exact types)
+_NORMALIZERS = {str: str.strip, float: _round_float}
+
+# Code points removed by str.strip(), for stripping text the same way in SQL
+_WHITESPACE_CODES = ", ".join(
+    str(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()
+)
+
+def normalize_value(value: Any) -> Any:
+    """
+    Normalize a single value for comparison.
+
+    Strings are stripped of surrounding whitespace and floats are rounded to
+    avoid precision issues; everything else is returned unchanged.
+    """
+    return _NORMALIZERS.get(type(value), _identity)(value)
+
+def column_normalizer(column: Iterable[Any]) -> Optional[Callable[[Any], Any]]:
+    """
+    Pick the cheapest normalizer valid for every value of a column.
+
+    Args:
+        column: Values of one column (e.g. for a batch of rows)
+
+    Returns:
+        Optional[Callable]: ``str.strip`` or the float rounder for a column of
+            a single type, ``normalize_value`` for mixed columns that need it,
+            or None when no value needs normalizing at all
+    """
+    types = set(map(type, column))
+    if len(types) == 1:
+        return _NORMALIZERS.get(types.pop())
+    if types.isdisjoint(_NORMALIZERS):
+        return None
+    return normalize_value
+
+def pack_value(value: Any) -> bytes:
+    """
+    Encode a normalized value as a length-prefixed, type-tagged byte string.
+
+    Integral floats are encoded like integers so that 1 and 1.0 still compare
+    equal, matching Python's own equality rules.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if value is None:
+        data = b"n"
+    elif isinstance(value, int):
+        data = b"i" + str(value).encode()
+    elif isinstance(value, float):
+        data = b"f" + repr(value).encode()
+    elif isinstance(value, str):
+        data = b"s" + value.encode("utf-8", "surrogatepass")
+    else:
+        data = b"b" + bytes(value)
+    return struct.pack("<I", len(data)) + data
+
+def normalize_row(row: Iterable[Any]) -> Tuple:
+    """
+    Normalize a row for comparison.
+
+    Args:
+        row: Row values in column order (e.g. a sqlite3.Row)
+
+    Returns:
+        Tuple: Normalized values, in the same column order
+    """
+    return tuple(normalize_value(value) for value in row)
+
+def _blake2b_128(data: bytes) -> bytes:
+    """Return the 128-bit BLAKE2b digest of ``data``."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# 128-bit digest function: xxh3 when xxhash is installed, BLAKE2b otherwise
+_digest128 = xxhash.xxh3_128_intdigest if xxhash is not None else _blake2b_128
+
+def hash_rows(rows: Iterable[Iterable[Any]]) -> Iterator[Hashable]:
+    """
+    Compute compact digests of normalized rows, one batch at a time.
+
+    Each batch of ``FETCH_BATCH_SIZE`` rows is transposed into columns so that
+    normalization and packing run as one ``map`` per column rather than a
+    Python-level loop per value; the packed columns are then zipped back into
+    rows and hashed in one call each, with xxh3 if the optional ``xxhash``
+    package is available and BLAKE2b otherwise. The normalizer is chosen once
+    per column and batch (see ``column_normalizer``), and skipped entirely for
+    e.g. integer columns.
+
+    Args:
+        rows: Rows with values in column order (e.g. sqlite3.Row objects)
+
+    Yields:
+        Hashable: 128-bit digest of each row, in input order (an int with
+            xxhash, 16 bytes otherwise)
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, FETCH_BATCH_SIZE))
+        if not batch:
+            return
+        packed_columns = []
+        for column in zip(*batch):
+            normalizer = column_normalizer(column)
+            if normalizer is not None:
+                column = map(normalizer, column)
+            packed_columns.append(list(map(pack_value, column)))
+        yield from map(_digest128, map(b"".join, zip(*packed_columns)))
+
+@dataclass(slots=True)
 class TableComparison:
     """Data class to store table comparison results."""
 
@@ -44,7 +186,7 @@ class TableComparison:
     is_identical: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseComparison:
     """Data class to store overall database comparison results."""
 
@@ -60,13 +202,17 @@ class DatabaseComparison:
 class SQLiteComparator:
     """Main class for comparing two SQLite databases."""
 
-    def __init__(self, db1_path: str, db2_path: str):
+    def __init__(
+        self, db1_path: str, db2_path: str, max_workers: Optional[int] = None
+    ):
         """
         Initialize the SQLite comparator.
 
         Args:
             db1_path: Path to the first database file
             db2_path: Path to the second database file
+            max_workers: Number of tables compared concurrently
+                (defaults to the CPU count, capped at 8)
 
         Raises:
             FileNotFoundError: If either database file doesn't exist
@@ -74,26 +220,101 @@ class SQLiteComparator:
         self.db1_path = Path(db1_path)
         self.db2_path = Path(db2_path)
         self.console = Console()
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+        # Per-database metadata, prefetched once per comparison run
+        self._schema_cache: Dict[Path, Dict[str, List[Tuple]]] = {}
+        self._row_count_cache: Dict[Path, Dict[str, int]] = {}
+
+        # Connection pairs of the worker threads, reused across tables
+        self._thread_local = threading.local()
+        self._worker_connections: List[Tuple[sqlite3.Connection, ...]] = []
+        self._worker_connections_lock = threading.Lock()
 
         if not self.db1_path.exists():
             raise FileNotFoundError(f"Database 1 not found: {db1_path}")
         if not self.db2_path.exists():
             raise FileNotFoundError(f"Database 2 not found: {db2_path}")
 
-    def get_connection(self, db_path: Path) -> sqlite3.Connection:
+    def get_database_uri(self, db_path: Path, read_only: bool = True) -> str:
         """
-        Create a database connection.
+        Build a SQLite URI for a database file.
 
         Args:
             db_path: Path to the database file
+            read_only: Whether to open the database in read-only mode
+
+        Returns:
+            str: ``file:`` URI for the database
+        """
+        uri = Path(db_path).resolve().as_uri()
+        return f"{uri}?mode=ro" if read_only else uri
+
+    def get_connection(
+        self, db_path: Path, read_only: bool = True
+    ) -> sqlite3.Connection:
+        """
+        Create a database connection tuned for full-table scans.
+
+        The comparator never writes, so by default the database is opened in
+        read-only mode with ``query_only`` set (which is also why the journal
+        and sync modes are left alone: they only matter for writes, and
+        switching to WAL would write to the file). Memory-mapped I/O, a
+        larger page cache and in-memory temporary storage are enabled either
+        way.
+
+        Args:
+            db_path: Path to the database file
+            read_only: Whether to open the database in read-only mode
 
         Returns:
             sqlite3.Connection: Database connection object
         """
-        conn = sqlite3.connect(db_path)
+        # Worker connections are closed by the main thread once the pool is
+        # done with them, so the same-thread check has to be relaxed
+        conn = sqlite3.connect(
+            self.get_database_uri(db_path, read_only),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        self.tune_schema(conn, "main")
         return conn
 
+    def tune_schema(self, conn: sqlite3.Connection, schema: str) -> None:
+        """
+        Apply the per-database cache and mmap settings to one schema.
+
+        ``cache_size`` only affects the schema it is set on, so attached
+        databases need to be tuned separately from ``main``.
+
+        Args:
+            conn: Database connection
+            schema: Schema name, e.g. ``main`` or an attached database alias
+        """
+        conn.execute(f"PRAGMA [{schema}].cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA [{schema}].mmap_size = {MMAP_SIZE}")
+
+    def attach_database(
+        self, conn: sqlite3.Connection, db_path: Path, alias: str = "db2"
+    ) -> None:
+        """
+        Attach another database file, read-only, to an existing connection.
+
+        Args:
+            conn: Database connection to attach to
+            db_path: Path to the database file to attach
+            alias: Schema name the attached database is available under
+        """
+        conn.execute(
+            f"ATTACH DATABASE ? AS [{alias}]", (self.get_database_uri(db_path),)
+        )
+        self.tune_schema(conn, alias)
+
     def get_table_names(self, conn: sqlite3.Connection) -> Set[str]:
         """
         Get all table names from a database.
@@ -126,7 +347,7 @@ class SQLiteComparator:
         cursor = conn.cursor()
         # Use square brackets to properly quote table names
         cursor.execute(f"PRAGMA table_info([{table_name}])")
-        return cursor.fetchall()
+        return [tuple(row) for row in cursor.fetchall()]
 
     def get_row_count(self, conn: sqlite3.Connection, table_name: str) -> int:
         """
@@ -144,22 +365,156 @@ class SQLiteComparator:
         cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
         return cursor.fetchone()[0]
 
-    def get_table_data(self, conn: sqlite3.Connection, table_name: str) -> List[Dict]:
+    def iter_table_rows(
+        self, conn: sqlite3.Connection, table_name: str
+    ) -> Iterator[Tuple]:
         """
-        Get all data from a table.
+        Lazily iterate over all rows of a table.
+
+        Rows are returned as plain tuples rather than ``sqlite3.Row`` objects,
+        since the comparison only needs positional values and skipping the
+        row factory saves an object per row.
 
         Args:
             conn: Database connection
             table_name: Name of the table
 
-        Returns:
-            List[Dict]: List of rows as dictionaries
+        Yields:
+            Tuple: One row at a time, fetched in batches of
+                ``FETCH_BATCH_SIZE`` without materializing the table
         """
         cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.arraysize = FETCH_BATCH_SIZE
         # Use square brackets to properly quote table names
         cursor.execute(f"SELECT * FROM [{table_name}]")
-        columns = [description[0] for description in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
+    def _load_all_schemas(
+        self, conn: sqlite3.Connection, table_names: Iterable[str]
+    ) -> Dict[str, List[Tuple]]:
+        """
+        Fetch the schema of every given table with a single query.
+
+        ``sqlite_master`` is joined with the ``pragma_table_info`` table-valued
+        function, yielding the same column definitions as ``get_table_schema``
+        for all tables at once.
+
+        Args:
+            conn: Database connection
+            table_names: Names of the tables
+
+        Returns:
+            Dict[str, List[Tuple]]: Column definitions keyed by table name
+        """
+        wanted = set(table_names)
+        schemas: Dict[str, List[Tuple]] = {name: [] for name in wanted}
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+            ORDER BY m.name, p.cid
+        """)
+        for row in cursor.fetchall():
+            if row[0] in wanted:
+                schemas[row[0]].append(tuple(row[1:]))
+        return schemas
+
+    def _load_row_counts(
+        self, conn: sqlite3.Connection, table_names: Iterable[str]
+    ) -> Dict[str, int]:
+        """
+        Count the rows of every given table with as few queries as possible.
+
+        One statement counts up to 500 tables at once, using one scalar
+        subquery per table.
+
+        Args:
+            conn: Database connection
+            table_names: Names of the tables
+
+        Returns:
+            Dict[str, int]: Number of rows keyed by table name
+        """
+        names = sorted(table_names)
+        counts: Dict[str, int] = {}
+        cursor = conn.cursor()
+        for start in range(0, len(names), 500):
+            chunk = names[start : start + 500]
+            cursor.execute(
+                "SELECT "
+                + ", ".join(f"(SELECT COUNT(*) FROM [{name}])" for name in chunk)
+            )
+            counts.update(zip(chunk, cursor.fetchone()))
+        return counts
+
+    def _cached_schema(
+        self, conn: sqlite3.Connection, db_path: Path, table_name: str
+    ) -> List[Tuple]:
+        """Return a table schema from the prefetched cache, querying on a miss."""
+        schemas = self._schema_cache.get(db_path, {})
+        if table_name in schemas:
+            return schemas[table_name]
+        return self.get_table_schema(conn, table_name)
+
+    def _cached_row_count(
+        self, conn: sqlite3.Connection, db_path: Path, table_name: str
+    ) -> int:
+        """Return a table row count from the prefetched cache, querying on a miss."""
+        counts = self._row_count_cache.get(db_path, {})
+        if table_name in counts:
+            return counts[table_name]
+        return self.get_row_count(conn, table_name)
+
+    def tables_match_in_order(
+        self,
+        conn1: sqlite3.Connection,
+        conn2: sqlite3.Connection,
+        table_name: str,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> bool:
+        """
+        Cheaply check whether a table holds exactly the same rows in both databases.
+
+        Both tables are scanned in rowid order in lockstep, ``batch_size`` rows
+        at a time, and the scan stops at the first batch that differs. Values
+        are compared as stored (without normalization), so ``False`` only means
+        that a full data comparison is needed.
+
+        Args:
+            conn1: Connection to database 1
+            conn2: Connection to database 2
+            table_name: Name of the table
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            bool: True if both tables contain the same rows in the same order
+        """
+        query = f"SELECT * FROM [{table_name}] ORDER BY rowid"
+        cursor1 = conn1.cursor()
+        cursor2 = conn2.cursor()
+        # Plain tuples compare faster than sqlite3.Row objects
+        cursor1.row_factory = cursor2.row_factory = None
+        try:
+            cursor1.execute(query)
+            cursor2.execute(query)
+        except sqlite3.OperationalError:
+            # e.g. WITHOUT ROWID tables
+            return False
+
+        while True:
+            batch1 = cursor1.fetchmany(batch_size)
+            batch2 = cursor2.fetchmany(batch_size)
+            if batch1 != batch2:
+                return False
+            if not batch1:
+                return True
 
     def compare_schemas(
         self, schema1: List[Tuple], schema2: List[Tuple]
@@ -202,20 +557,27 @@ class SQLiteComparator:
         return len(differences) == 0, differences
 
     def compare_table_data(
-        self, data1: List[Dict], data2: List[Dict]
+        self, rows1: Iterable[Tuple], rows2: Iterable[Tuple]
     ) -> Dict[str, Any]:
         """
         Compare data between two tables.
 
+        Rows of database 1 are streamed through ``hash_rows`` into a Counter
+        of digests and database 2's digests are subtracted from it in the
+        same pass, so only one Counter is held in memory and duplicate rows
+        are counted correctly. When both sides have fewer than
+        ``SMALL_TABLE_ROWS`` rows, the normalized rows are matched with a
+        simple list scan instead, which is cheaper than hashing at that size.
+
         Args:
-            data1: Data from database 1
-            data2: Data from database 2
+            rows1: Rows from database 1
+            rows2: Rows from database 2
 
         Returns:
             Dict[str, Any]: Dictionary containing comparison results
         """
         differences = {
-            "row_count_match": len(data1) == len(data2),
+            "row_count_match": False,
             "rows_only_in_db1": 0,
             "rows_only_in_db2": 0,
             "modified_rows": 0,
@@ -223,58 +585,206 @@ class SQLiteComparator:
             "is_data_identical": False,
         }
 
-        # If both are empty, they're identical
-        if len(data1) == 0 and len(data2) == 0:
-            differences["is_data_identical"] = True
-            return differences
-
-        # Normalize data for comparison (handle None, strip strings, etc.)
-        def normalize_row(row: Dict) -> frozenset:
-            """Normalize a row for comparison."""
-            normalized = {}
-            for key, value in row.items():
-                # Handle None values
-                if value is None:
-                    normalized[key] = None
-                # Strip whitespace from strings
-                elif isinstance(value, str):
-                    normalized[key] = value.strip()
-                # Handle floating point numbers (round to avoid precision issues)
-                elif isinstance(value, float):
-                    normalized[key] = round(value, 10)
-                else:
-                    normalized[key] = value
-            return frozenset(normalized.items())
-
-        # Convert to sets for comparison
         try:
-            data1_set = {normalize_row(row) for row in data1}
-            data2_set = {normalize_row(row) for row in data2}
-
-            # Calculate differences
-            only_in_db1 = data1_set - data2_set
-            only_in_db2 = data2_set - data1_set
-            identical = data1_set & data2_set
-
-            differences["rows_only_in_db1"] = len(only_in_db1)
-            differences["rows_only_in_db2"] = len(only_in_db2)
-            differences["identical_rows"] = len(identical)
+            rows1 = iter(rows1)
+            rows2 = iter(rows2)
+            head1 = list(islice(rows1, SMALL_TABLE_ROWS))
+            head2 = list(islice(rows2, SMALL_TABLE_ROWS))
+
+            if len(head1) < SMALL_TABLE_ROWS and len(head2) < SMALL_TABLE_ROWS:
+                # Small tables: match each row against the remaining rows of DB2
+                unmatched = [normalize_row(row) for row in head2]
+                identical = 0
+                for row in map(normalize_row, head1):
+                    if row in unmatched:
+                        unmatched.remove(row)
+                        identical += 1
+                only_in_db1 = len(head1) - identical
+                only_in_db2 = len(unmatched)
+            else:
+                counts = Counter(hash_rows(chain(head1, rows1)))
+                total_db1 = counts.total()
+                counts.subtract(hash_rows(chain(head2, rows2)))
+
+                # Positive counts are surplus rows in DB1, negative ones in DB2
+                only_in_db1 = only_in_db2 = 0
+                for count in counts.values():
+                    if count > 0:
+                        only_in_db1 += count
+                    elif count < 0:
+                        only_in_db2 -= count
+                identical = total_db1 - only_in_db1
+
+            differences["row_count_match"] = only_in_db1 == only_in_db2
+            differences["rows_only_in_db1"] = only_in_db1
+            differences["rows_only_in_db2"] = only_in_db2
+            differences["identical_rows"] = identical
 
             # Check if data is truly identical
-            differences["is_data_identical"] = (
-                len(only_in_db1) == 0
-                and len(only_in_db2) == 0
-                and len(data1) == len(data2)
-            )
+            differences["is_data_identical"] = only_in_db1 == 0 and only_in_db2 == 0
 
         except Exception as e:
-            # Fallback to simple comparison if normalization fails
             differences["comparison_error"] = str(e)
-            differences["rows_only_in_db1"] = len(data1)
-            differences["rows_only_in_db2"] = len(data2)
 
         return differences
 
+    def normalized_column_sql(self, column: str, alias: str = "") -> str:
+        """
+        Build a SQL expression normalizing a column like ``normalize_value``.
+
+        Text is trimmed of every character ``str.strip`` removes. Reals go
+        through SQLite's ``round``, which agrees with Python's ``round`` except
+        for a small share of values lying right on a rounding boundary at the
+        10th decimal, where the two can round in opposite directions.
+
+        Args:
+            column: Name of the column
+            alias: Optional table alias to qualify the column with
+
+        Returns:
+            str: SQL expression yielding the normalized column value
+        """
+        ref = f"{alias}.[{column}]" if alias else f"[{column}]"
+        return (
+            f"CASE typeof({ref}) "
+            f"WHEN 'text' THEN trim({ref}, char({_WHITESPACE_CODES})) "
+            f"WHEN 'real' THEN round({ref}, 10) "
+            f"ELSE {ref} END"
+        )
+
+    def text_key_column_sql(self, column: str) -> str:
+        """
+        Build a SQL expression giving the text form of a column for matching.
+
+        Values are compared by their text form so that values stored with
+        different types (e.g. ``1`` and ``'1'``) still match. Reals are
+        written like ``str(float)``: the shortest of 15 to 17 significant
+        digits that reads back as the same value (``CAST`` alone keeps only
+        15 and would merge close values), with a trailing ``.0`` on integral
+        values and exponents only below 1e-4 or from 1e16 on. SQLite's own
+        digit generation can still differ from Python's in the 17th digit.
+        NULL maps to an empty blob, which equals itself under ``=`` and
+        ``IN`` but never any text, and blobs are rendered with ``quote`` to
+        stay valid UTF-8.
+
+        Args:
+            column: Name of the column
+
+        Returns:
+            str: SQL expression yielding the matching key of the column value
+        """
+        ref = f"[{column}]"
+
+        def digits(count: int) -> str:
+            # '!' keeps the '.0' of integral values and allows 17 digits
+            return f"printf('%!.{count}g', {ref})"
+
+        def round_trips(text: str) -> str:
+            return f"CAST({text} AS REAL) = {ref}"
+
+        # %.Ng switches to an exponent from 1eN on, str() always from 1e16 on
+        real_text = (
+            f"replace(CASE "
+            f"WHEN (abs({ref}) < 1e15 OR abs({ref}) >= 1e16) "
+            f"AND {round_trips(digits(15))} THEN {digits(15)} "
+            f"WHEN {round_trips(digits(16))} THEN {digits(16)} "
+            f"WHEN abs({ref}) >= 1e16 AND abs({ref}) < 1e17 "
+            f"THEN printf('%!.16e', {ref}) "
+            f"ELSE {digits(17)} END, '.0e', 'e')"
+        )
+        return (
+            f"CASE typeof({ref}) "
+            f"WHEN 'null' THEN x'' "
+            f"WHEN 'real' THEN {real_text} "
+            f"WHEN 'blob' THEN quote({ref}) "
+            f"ELSE CAST({ref} AS TEXT) END"
+        )
+
+    def compare_table_data_sql(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str,
+        schema: List[Tuple],
+        row_count_db1: int,
+        row_count_db2: int,
+    ) -> Dict[str, Any]:
+        """
+        Compare data between two tables inside SQLite.
+
+        Database 2 must be attached to ``conn`` as ``db2``. Values are
+        normalized in SQL following ``normalize_value``, see
+        ``normalized_column_sql`` for where the two can differ.
+
+        Tables keyed by a single INTEGER PRIMARY KEY hold at most one row per
+        key, so rows are matched by key through the primary key index and
+        only the matches are counted. Otherwise rows from both sides are
+        grouped in a single ``UNION ALL`` scan and the per-group counts give
+        the rows only in either database, so duplicate rows are counted rather
+        than collapsed as with ``EXCEPT``.
+
+        Args:
+            conn: Connection to database 1 with database 2 attached as ``db2``
+            table_name: Name of the table to compare
+            schema: Schema of the table (identical in both databases)
+            row_count_db1: Number of rows in the table in database 1
+            row_count_db2: Number of rows in the table in database 2
+
+        Returns:
+            Dict[str, Any]: Dictionary containing comparison results
+        """
+        pk_cols = [col for col in schema if col[5] != 0]  # PK flag is at index 5
+        cursor = conn.cursor()
+
+        if len(pk_cols) == 1 and pk_cols[0][2].upper() == "INTEGER":
+            pk_name = pk_cols[0][1]
+            matches = " AND ".join(
+                f"{self.normalized_column_sql(col[1], 'a')} "
+                f"IS {self.normalized_column_sql(col[1], 'b')}"
+                for col in schema
+                if col[1] != pk_name
+            )
+            cursor.execute(
+                f"""
+                SELECT COUNT(*)
+                FROM main.[{table_name}] AS a
+                JOIN db2.[{table_name}] AS b ON b.[{pk_name}] = a.[{pk_name}]
+                {f"WHERE {matches}" if matches else ""}
+            """
+            )
+            identical = cursor.fetchone()[0]
+            only_in_db1 = row_count_db1 - identical
+            only_in_db2 = row_count_db2 - identical
+        else:
+            normalized = ", ".join(
+                f"{self.normalized_column_sql(col[1])} AS c{idx}"
+                for idx, col in enumerate(schema)
+            )
+            group_by = ", ".join(f"c{idx}" for idx in range(len(schema)))
+            cursor.execute(
+                f"""
+                SELECT IFNULL(SUM(MAX(n1 - n2, 0)), 0), IFNULL(SUM(MAX(n2 - n1, 0)), 0)
+                FROM (
+                    SELECT SUM(side = 1) AS n1, SUM(side = 2) AS n2
+                    FROM (
+                        SELECT 1 AS side, {normalized} FROM main.[{table_name}]
+                        UNION ALL
+                        SELECT 2 AS side, {normalized} FROM db2.[{table_name}]
+                    )
+                    GROUP BY {group_by}
+                )
+            """
+            )
+            only_in_db1, only_in_db2 = cursor.fetchone()
+
+        return {
+            "row_count_match": only_in_db1 == only_in_db2,
+            "rows_only_in_db1": only_in_db1,
+            "rows_only_in_db2": only_in_db2,
+            "modified_rows": 0,
+            "identical_rows": row_count_db1 - only_in_db1,
+            "is_data_identical": only_in_db1 == 0 and only_in_db2 == 0,
+        }
+
     def compare_table(
         self, conn1: sqlite3.Connection, conn2: sqlite3.Connection, table_name: str
     ) -> TableComparison:
@@ -282,7 +792,7 @@ class SQLiteComparator:
         Compare a single table between two databases.
 
         Args:
-            conn1: Connection to database 1
+            conn1: Connection to database 1, with database 2 attached as ``db2``
             conn2: Connection to database 2
             table_name: Name of the table to compare
 
@@ -292,8 +802,8 @@ class SQLiteComparator:
         comparison = TableComparison(table_name=table_name)
 
         # Get schemas
-        schema1 = self.get_table_schema(conn1, table_name)
-        schema2 = self.get_table_schema(conn2, table_name)
+        schema1 = self._cached_schema(conn1, self.db1_path, table_name)
+        schema2 = self._cached_schema(conn2, self.db2_path, table_name)
 
         # Compare schemas
         comparison.schema_match, comparison.schema_diff = self.compare_schemas(
@@ -301,14 +811,41 @@ class SQLiteComparator:
         )
 
         # Get row counts
-        comparison.row_count_db1 = self.get_row_count(conn1, table_name)
-        comparison.row_count_db2 = self.get_row_count(conn2, table_name)
+        comparison.row_count_db1 = self._cached_row_count(
+            conn1, self.db1_path, table_name
+        )
+        comparison.row_count_db2 = self._cached_row_count(
+            conn2, self.db2_path, table_name
+        )
 
-        # Compare data if schemas match
+        # Compare data if schemas match: first a cheap in-order check for
+        # identical tables, then a full comparison in SQLite where possible
         if comparison.schema_match:
-            data1 = self.get_table_data(conn1, table_name)
-            data2 = self.get_table_data(conn2, table_name)
-            comparison.data_differences = self.compare_table_data(data1, data2)
+            if comparison.row_count_db1 == comparison.row_count_db2 and (
+                self.tables_match_in_order(conn1, conn2, table_name)
+            ):
+                comparison.data_differences = {
+                    "row_count_match": True,
+                    "rows_only_in_db1": 0,
+                    "rows_only_in_db2": 0,
+                    "modified_rows": 0,
+                    "identical_rows": comparison.row_count_db1,
+                    "is_data_identical": True,
+                }
+            else:
+                try:
+                    comparison.data_differences = self.compare_table_data_sql(
+                        conn1,
+                        table_name,
+                        schema1,
+                        comparison.row_count_db1,
+                        comparison.row_count_db2,
+                    )
+                except sqlite3.OperationalError:
+                    comparison.data_differences = self.compare_table_data(
+                        self.iter_table_rows(conn1, table_name),
+                        self.iter_table_rows(conn2, table_name),
+                    )
 
         # Determine if table is identical - UPDATED LOGIC
         comparison.is_identical = (
@@ -319,6 +856,56 @@ class SQLiteComparator:
 
         return comparison
 
+    def open_connection_pair(self) -> Tuple[sqlite3.Connection, sqlite3.Connection]:
+        """
+        Open connections to both databases.
+
+        Returns:
+            Tuple[sqlite3.Connection, sqlite3.Connection]: Connections to
+                database 1 (with database 2 attached as ``db2``) and database 2
+        """
+        conn1 = self.get_connection(self.db1_path)
+        self.attach_database(conn1, self.db2_path)
+        conn2 = self.get_connection(self.db2_path)
+        return conn1, conn2
+
+    def _thread_connections(self) -> Tuple[sqlite3.Connection, sqlite3.Connection]:
+        """
+        Return the calling thread's connection pair, opening it on first use.
+
+        SQLite connections cannot be shared between threads, so each worker
+        thread keeps its own pair and reuses it for every table it compares.
+        """
+        connections = getattr(self._thread_local, "connections", None)
+        if connections is None:
+            connections = self.open_connection_pair()
+            self._thread_local.connections = connections
+            with self._worker_connections_lock:
+                self._worker_connections.append(connections)
+        return connections
+
+    def _close_worker_connections(self) -> None:
+        """Close every connection opened by worker threads."""
+        with self._worker_connections_lock:
+            for connections in self._worker_connections:
+                for conn in connections:
+                    conn.close()
+            self._worker_connections.clear()
+        self._thread_local = threading.local()
+
+    def _compare_table_in_worker(self, table_name: str) -> TableComparison:
+        """
+        Compare a single table on the worker thread's own connections.
+
+        Args:
+            table_name: Name of the table to compare
+
+        Returns:
+            TableComparison: Comparison results for the table
+        """
+        conn1, conn2 = self._thread_connections()
+        return self.compare_table(conn1, conn2, table_name)
+
     def compare_databases(self) -> DatabaseComparison:
         """
         Perform complete comparison of two databases.
@@ -331,8 +918,8 @@ class SQLiteComparator:
         )
 
         with (
-            self.get_connection(self.db1_path) as conn1,
-            self.get_connection(self.db2_path) as conn2,
+            closing(self.get_connection(self.db1_path)) as conn1,
+            closing(self.get_connection(self.db2_path)) as conn2,
         ):
             # Get table names
             tables1 = self.get_table_names(conn1)
@@ -343,16 +930,31 @@ class SQLiteComparator:
             comparison.tables_only_in_db2 = tables2 - tables1
             comparison.common_tables = tables1 & tables2
 
-            # Compare common tables
-            for table_name in comparison.common_tables:
-                table_comp = self.compare_table(conn1, conn2, table_name)
-                comparison.table_comparisons[table_name] = table_comp
-                if not table_comp.is_identical:
-                    comparison.is_identical = False
-
-            # If there are tables only in one database, they're not identical
-            if comparison.tables_only_in_db1 or comparison.tables_only_in_db2:
-                comparison.is_identical = False
+            # Prefetch schemas and row counts for the common tables
+            self._schema_cache = {
+                self.db1_path: self._load_all_schemas(conn1, comparison.common_tables),
+                self.db2_path: self._load_all_schemas(conn2, comparison.common_tables),
+            }
+            self._row_count_cache = {
+                self.db1_path: self._load_row_counts(conn1, comparison.common_tables),
+                self.db2_path: self._load_row_counts(conn2, comparison.common_tables),
+            }
+
+        # Compare common tables concurrently, one connection pair per thread
+        common_tables = sorted(comparison.common_tables)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(self._compare_table_in_worker, common_tables)
+                for table_name, table_comp in zip(common_tables, results):
+                    comparison.table_comparisons[table_name] = table_comp
+                    if not table_comp.is_identical:
+                        comparison.is_identical = False
+        finally:
+            self._close_worker_connections()
+
+        # If there are tables only in one database, they're not identical
+        if comparison.tables_only_in_db1 or comparison.tables_only_in_db2:
+            comparison.is_identical = False
 
         return comparison
 
@@ -363,7 +965,21 @@ class SQLiteComparator:
         Args:
             comparison: DatabaseComparison object with results
         """
-        self.console.print("\n")
+        # Everything is collected into a single Group and printed at once
+        renderables: List[Any] = ["\n"]
+
+        # Sort and join each table list once, reused throughout the report
+        common_sorted = sorted(comparison.common_tables)
+        only_db1_sorted = sorted(comparison.tables_only_in_db1)
+        only_db2_sorted = sorted(comparison.tables_only_in_db2)
+        non_identical_tables = [
+            name
+            for name in common_sorted
+            if not comparison.table_comparisons[name].is_identical
+        ]
+        common_joined = ", ".join(common_sorted)
+        only_db1_joined = ", ".join(only_db1_sorted)
+        only_db2_joined = ", ".join(only_db2_sorted)
 
         # Header
         header = Panel(
@@ -375,7 +991,7 @@ class SQLiteComparator:
             style="bold blue",
             box=box.DOUBLE,
         )
-        self.console.print(header)
+        renderables.append(header)
 
         # Database paths
         paths_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan")
@@ -383,8 +999,8 @@ class SQLiteComparator:
         paths_table.add_column("Path", style="white")
         paths_table.add_row("Database 1:", comparison.db1_path)
         paths_table.add_row("Database 2:", comparison.db2_path)
-        self.console.print(paths_table)
-        self.console.print()
+        renderables.append(paths_table)
+        renderables.append("")
 
         # Overall summary
         if comparison.is_identical:
@@ -393,7 +1009,7 @@ class SQLiteComparator:
                 style="green",
                 box=box.DOUBLE,
             )
-            self.console.print(summary_panel)
+            renderables.append(summary_panel)
         else:
             summary_panel = Panel(
                 Text(
@@ -402,9 +1018,9 @@ class SQLiteComparator:
                 style="red",
                 box=box.DOUBLE,
             )
-            self.console.print(summary_panel)
+            renderables.append(summary_panel)
 
-        self.console.print()
+        renderables.append("")
 
         # Table structure comparison
         structure_table = Table(title="Table Structure Comparison", box=box.HEAVY_EDGE)
@@ -419,46 +1035,43 @@ class SQLiteComparator:
             comparison.tables_only_in_db2
         )
 
+        all_tables_db1 = ", ".join(sorted(common_sorted + only_db1_sorted))
+        all_tables_db2 = ", ".join(sorted(common_sorted + only_db2_sorted))
+
         structure_table.add_row(
-            "Total Tables in DB1",
-            str(total_tables_db1),
-            ", ".join(sorted(comparison.common_tables | comparison.tables_only_in_db1))
-            or "None",
+            "Total Tables in DB1", str(total_tables_db1), all_tables_db1 or "None"
         )
         structure_table.add_row(
-            "Total Tables in DB2",
-            str(total_tables_db2),
-            ", ".join(sorted(comparison.common_tables | comparison.tables_only_in_db2))
-            or "None",
+            "Total Tables in DB2", str(total_tables_db2), all_tables_db2 or "None"
         )
         structure_table.add_row(
             "[green]Common Tables[/green]",
             f"[green]{len(comparison.common_tables)}[/green]",
-            f"[green]{', '.join(sorted(comparison.common_tables)) or 'None'}[/green]",
+            f"[green]{common_joined or 'None'}[/green]",
         )
 
         if comparison.tables_only_in_db1:
             structure_table.add_row(
                 "[red]Only in DB1[/red]",
                 f"[red]{len(comparison.tables_only_in_db1)}[/red]",
-                f"[red]{', '.join(sorted(comparison.tables_only_in_db1))}[/red]",
+                f"[red]{only_db1_joined}[/red]",
             )
 
         if comparison.tables_only_in_db2:
             structure_table.add_row(
                 "[red]Only in DB2[/red]",
                 f"[red]{len(comparison.tables_only_in_db2)}[/red]",
-                f"[red]{', '.join(sorted(comparison.tables_only_in_db2))}[/red]",
+                f"[red]{only_db2_joined}[/red]",
             )
 
-        self.console.print(structure_table)
-        self.console.print()
+        renderables.append(structure_table)
+        renderables.append("")
 
         # Detailed table comparisons
         if comparison.common_tables:
-            self.console.print(Panel("Detailed Table Comparisons", style="bold yellow"))
+            renderables.append(Panel("Detailed Table Comparisons", style="bold yellow"))
 
-            for table_name in sorted(comparison.common_tables):
+            for table_name in common_sorted:
                 table_comp = comparison.table_comparisons[table_name]
 
                 # Determine border color
@@ -506,7 +1119,7 @@ class SQLiteComparator:
                     f"[{schema_style}]{schema_status}[/{schema_style}]",
                 )
 
-                self.console.print(details_table)
+                renderables.append(details_table)
 
                 # Schema differences
                 if table_comp.schema_diff:
@@ -516,7 +1129,7 @@ class SQLiteComparator:
                         style="red",
                         box=box.ROUNDED,
                     )
-                    self.console.print(diff_panel)
+                    renderables.append(diff_panel)
 
                 # Data differences
                 if table_comp.data_differences:
@@ -545,12 +1158,12 @@ class SQLiteComparator:
                         )
 
                     if data_table.row_count > 0:
-                        self.console.print(data_table)
+                        renderables.append(data_table)
 
-                self.console.print()
+                renderables.append("")
 
         # Final summary
-        self.console.print(Panel("Summary", style="bold magenta"))
+        renderables.append(Panel("Summary", style="bold magenta"))
 
         summary_tree = Tree("📊 Comparison Summary")
 
@@ -565,28 +1178,22 @@ class SQLiteComparator:
                 db1_only_node = diff_node.add(
                     f"[red]• {len(comparison.tables_only_in_db1)} table(s) only in DB1[/red]"
                 )
-                for table in sorted(comparison.tables_only_in_db1):
+                for table in only_db1_sorted:
                     db1_only_node.add(f"[red]└─ {table}[/red]")
 
             if comparison.tables_only_in_db2:
                 db2_only_node = diff_node.add(
                     f"[red]• {len(comparison.tables_only_in_db2)} table(s) only in DB2[/red]"
                 )
-                for table in sorted(comparison.tables_only_in_db2):
+                for table in only_db2_sorted:
                     db2_only_node.add(f"[red]└─ {table}[/red]")
 
-            non_identical_tables = [
-                name
-                for name, comp in comparison.table_comparisons.items()
-                if not comp.is_identical
-            ]
-
             if non_identical_tables:
                 tables_diff_node = diff_node.add(
                     f"[red]• {len(non_identical_tables)} common table(s) with differences:[/red]"
                 )
 
-                for table_name in sorted(non_identical_tables):
+                for table_name in non_identical_tables:
                     table_comp = comparison.table_comparisons[table_name]
                     table_node = tables_diff_node.add(
                         f"[yellow]📋 {table_name}[/yellow]"
@@ -635,8 +1242,8 @@ class SQLiteComparator:
                                 table_node.add(
                                     f"[green]✓ {diff_data['identical_rows']} identical row(s)[/green]"
                                 )
-        self.console.print(summary_tree)
-        self.console.print()
+        renderables.append(summary_tree)
+        renderables.append("")
 
         # Key Differences Panel
         key_diff_text = Text()
@@ -647,18 +1254,18 @@ class SQLiteComparator:
             if comparison.tables_only_in_db1:
                 key_diff_text.append("[❌] ", style="bold red")
                 key_diff_text.append("Tables existing only in DB1: ", style="bold red")
-                key_diff_text.append(", ".join(sorted(comparison.tables_only_in_db1)), style="red")
+                key_diff_text.append(only_db1_joined, style="red")
                 key_diff_text.append("\n")
 
             # Tables only in DB2
             if comparison.tables_only_in_db2:
                 key_diff_text.append("[❌] ", style="bold red")
                 key_diff_text.append("Tables existing only in DB2: ", style="bold red")
-                key_diff_text.append(", ".join(sorted(comparison.tables_only_in_db2)), style="red")
+                key_diff_text.append(only_db2_joined, style="red")
                 key_diff_text.append("\n")
 
             # Common tables
-            for table_name in sorted(comparison.common_tables):
+            for table_name in common_sorted:
                 table_comp = comparison.table_comparisons[table_name]
                 if table_comp.is_identical:
                     key_diff_text.append("[✅] ", style="bold green")
@@ -688,11 +1295,11 @@ class SQLiteComparator:
                     key_diff_text.append("\n")
 
         key_diff_panel = Panel(key_diff_text, title="Key Differences", style="bold magenta", box=box.ROUNDED)
-        self.console.print(key_diff_panel)
+        renderables.append(key_diff_panel)
 
         # Add a detailed differences table
         if not comparison.is_identical:
-            self.console.print()
+            renderables.append("")
             diff_summary_table = Table(
                 title="📋 Quick Differences Overview",
                 box=box.HEAVY_EDGE,
@@ -703,14 +1310,14 @@ class SQLiteComparator:
             diff_summary_table.add_column("Details", style="white")
 
             # Tables only in one DB
-            for table in sorted(comparison.tables_only_in_db1):
+            for table in only_db1_sorted:
                 diff_summary_table.add_row(
                     table,
                     "[red]Missing in DB2[/red]",
                     "Table exists only in Database 1",
                 )
 
-            for table in sorted(comparison.tables_only_in_db2):
+            for table in only_db2_sorted:
                 diff_summary_table.add_row(
                     table,
                     "[red]Missing in DB1[/red]",
@@ -718,7 +1325,7 @@ class SQLiteComparator:
                 )
 
             # Common tables with differences
-            for table_name in sorted(non_identical_tables):  # type: ignore
+            for table_name in non_identical_tables:
                 table_comp = comparison.table_comparisons[table_name]
                 issues = []
 
@@ -755,33 +1362,186 @@ class SQLiteComparator:
                     " | ".join(issues) if issues else "Unknown difference",
                 )
 
-            self.console.print(diff_summary_table)
-            self.console.print()
+            renderables.append(diff_summary_table)
+            renderables.append("")
+
+        self.console.print(Group(*renderables))
+
+        if not comparison.is_identical:
             self.display_detailed_differences(comparison)
 
-    def detailed_table_comparison(self, table_name: str, compare_columns: List[str]):
+    def values_equal_sql(self, left: str, right: str) -> str:
         """
-        Perform detailed comparison of a specific table using primary key for matching and showing differences for selected columns.
+        Build a SQL predicate that is true when two values are equal in Python.
+
+        NULLs match each other and integers match reals numerically; any other
+        values only match with the same storage type and the same bytes, so
+        column affinity and collations cannot make different values equal.
+
+        Args:
+            left: SQL expression of the first value
+            right: SQL expression of the second value
+
+        Returns:
+            str: SQL predicate comparing the two values
         """
-        with self.get_connection(self.db1_path) as conn1, self.get_connection(self.db2_path) as conn2:
-            schema1 = self.get_table_schema(conn1, table_name)
-            pk_cols = [col[1] for col in schema1 if col[5] != 0]  # PK flag is at index 5
-            if not pk_cols:
-                pk_cols = [schema1[0][1]] if schema1 else []  # Fall back to first column
+        numeric = "('integer', 'real')"
+        return (
+            f"({left} IS {right} COLLATE BINARY "
+            f"AND (typeof({left}) = typeof({right}) "
+            f"OR (typeof({left}) IN {numeric} AND typeof({right}) IN {numeric})))"
+        )
 
-            self.console.print(gen(f"Using primary key(s): {', '.join(pk_cols)} for matching", "bold yellow"))
+    def _match_columns(self, schema: List[Tuple]) -> List[str]:
+        """Return the primary key columns, or the first column if there is none."""
+        pk_cols = [col[1] for col in schema if col[5] != 0]  # PK flag is at index 5
+        if not pk_cols:
+            pk_cols = [schema[0][1]] if schema else []  # Fall back to first column
+        return pk_cols
+
+    def _keyed_rows_sql(
+        self,
+        conn: sqlite3.Connection,
+        schema_name: str,
+        table_name: str,
+        key_cols: List[str],
+    ) -> str:
+        """
+        Build the source of a table's rows with at most one row per key.
+
+        A table whose primary key or a unique index lies within the key
+        columns is used as is, provided those columns hold no NULLs (unique
+        constraints allow repeated NULLs). Otherwise, e.g. when matching
+        falls back to a non-unique first column, only the last row of each
+        key is kept, as a dict keyed by the columns would; joining all rows
+        would pair every row with every other row sharing its key.
+
+        Args:
+            conn: Connection to the database holding ``schema_name``
+            schema_name: Schema of the table (``main`` or ``db2``)
+            table_name: Name of the table
+            key_cols: Columns rows are matched by
+
+        Returns:
+            str: SQL table or subquery to select the rows from
+        """
+        table = f"{schema_name}.[{table_name}]"
+        keys = set(key_cols)
+        cursor = conn.cursor()
+        cursor.row_factory = None
 
-            data1 = self.get_table_data(conn1, table_name)
-            data2 = self.get_table_data(conn2, table_name)
+        cursor.execute(
+            "SELECT name FROM pragma_table_info(?, ?) WHERE pk > 0",
+            (table_name, schema_name),
+        )
+        unique_keys = [{name for (name,) in cursor.fetchall()}]
+        cursor.execute(
+            "SELECT name FROM pragma_index_list(?, ?) WHERE \"unique\"",
+            (table_name, schema_name),
+        )
+        for (index_name,) in cursor.fetchall():
+            cursor.execute(
+                "SELECT name FROM pragma_index_info(?, ?)", (index_name, schema_name)
+            )
+            unique_keys.append({name for (name,) in cursor.fetchall()})
+
+        for unique in unique_keys:
+            if unique and unique <= keys:
+                has_nulls = " OR ".join(f"[{col}] IS NULL" for col in unique)
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table} WHERE {has_nulls})")
+                if not cursor.fetchone()[0]:
+                    return table
+
+        # BINARY keeps e.g. 'a' and 'A' apart like Python, 1 and 1.0 still group
+        group_by = ", ".join(f"[{col}] COLLATE BINARY" for col in key_cols)
+        return (
+            f"(SELECT * FROM {table} WHERE rowid IN "
+            f"(SELECT MAX(rowid) FROM {table} GROUP BY {group_by}))"
+        )
 
-        def make_key(row):
-            return tuple(row.get(col) for col in pk_cols)
+    def _key_join_sql(self, pk_cols: List[str]) -> str:
+        """
+        Build the join condition matching rows of ``a`` and ``b`` by key.
 
-        data1_map = {make_key(row): row for row in data1 if make_key(row)}
-        data2_map = {make_key(row): row for row in data2 if make_key(row)}
+        The plain ``IS`` lets SQLite look up ``b`` through its key index and
+        matches NULL keys like Python's ``None``; the strict comparison then
+        drops matches Python would not consider equal.
+        """
+        return " AND ".join(
+            f"b.[{col}] IS a.[{col}] AND "
+            + self.values_equal_sql(f"a.[{col}]", f"b.[{col}]")
+            for col in pk_cols
+        )
 
-        common_keys = set(data1_map) & set(data2_map)
-        mismatched_rows = [k for k in common_keys if any(data1_map[k].get(col) != data2_map[k].get(col) for col in compare_columns)]
+    def get_mismatched_columns(self, table_name: str) -> Set[str]:
+        """
+        Find the columns whose values differ between rows with the same primary key.
+
+        Rows are joined by key inside SQLite, so neither table is loaded into
+        memory.
+        """
+        with closing(self.get_connection(self.db1_path)) as conn:
+            self.attach_database(conn, self.db2_path)
+            schema = self._cached_schema(conn, self.db1_path, table_name)
+            columns = [col[1] for col in schema]
+            if not columns:
+                return set()
+
+            flags = ", ".join(
+                "IFNULL(MAX(NOT "
+                + self.values_equal_sql(f"a.[{col}]", f"b.[{col}]")
+                + "), 0)"
+                for col in columns
+            )
+            key_cols = self._match_columns(schema)
+            rows1 = self._keyed_rows_sql(conn, "main", table_name, key_cols)
+            rows2 = self._keyed_rows_sql(conn, "db2", table_name, key_cols)
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {flags}
+                FROM {rows1} AS a
+                JOIN {rows2} AS b ON {self._key_join_sql(key_cols)}
+            """
+            )
+            differs = cursor.fetchone()
+
+        return {col for col, flag in zip(columns, differs) if flag}
+
+    def detailed_table_comparison(self, table_name: str, compare_columns: List[str]):
+        """
+        Perform detailed comparison of a specific table using primary key for matching and showing differences for selected columns.
+        """
+        with closing(self.get_connection(self.db1_path)) as conn:
+            self.attach_database(conn, self.db2_path)
+            schema1 = self.get_table_schema(conn, table_name)
+            pk_cols = self._match_columns(schema1)
+
+            self.console.print(gen(f"Using primary key(s): {', '.join(pk_cols)} for matching", "bold yellow"))
+
+            # Only the mismatched rows leave SQLite, ordered by key
+            mismatched_rows = []
+            if pk_cols and compare_columns:
+                keys = ", ".join(f"a.[{col}]" for col in pk_cols)
+                values = ", ".join(f"a.[{col}], b.[{col}]" for col in compare_columns)
+                differs = " OR ".join(
+                    "NOT " + self.values_equal_sql(f"a.[{col}]", f"b.[{col}]")
+                    for col in compare_columns
+                )
+                rows1 = self._keyed_rows_sql(conn, "main", table_name, pk_cols)
+                rows2 = self._keyed_rows_sql(conn, "db2", table_name, pk_cols)
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(
+                    f"""
+                    SELECT {keys}, {values}
+                    FROM {rows1} AS a
+                    JOIN {rows2} AS b ON {self._key_join_sql(pk_cols)}
+                    WHERE {differs}
+                    ORDER BY {keys}
+                """
+                )
+                mismatched_rows = cursor.fetchall()
 
         if not mismatched_rows:
             self.console.print(gen("No mismatched data in selected columns.", "bold green"))
@@ -789,9 +1549,9 @@ class SQLiteComparator:
 
         self.console.print(gen(f"Found {len(mismatched_rows)} mismatched rows in selected columns.", "bold red"))
 
-        for key in mismatched_rows:
-            row1 = data1_map[key]
-            row2 = data2_map[key]
+        for row in mismatched_rows:
+            key = row[: len(pk_cols)]
+            values = row[len(pk_cols) :]
 
             diff_table = Table(title=gen(f"Mismatched Row (Key: {key})", "bold red"), box=box.DOUBLE, border_style="red", show_header=True)
             diff_table.add_column("Key", style="bold yellow")
@@ -800,9 +1560,7 @@ class SQLiteComparator:
                 diff_table.add_column(f"{col} - DB2", style="magenta")
 
             row_data = [str(key)]
-            for col in compare_columns:
-                v1 = row1.get(col, "NULL")
-                v2 = row2.get(col, "NULL")
+            for v1, v2 in zip(values[::2], values[1::2]):
                 style1 = "red" if v1 != v2 else "green"
                 style2 = "red" if v1 != v2 else "green"
                 row_data.append(gen(str(v1), style1))
@@ -813,17 +1571,23 @@ class SQLiteComparator:
 
     def analyze_row_differences(
         self,
-        data1: List[Dict],
-        data2: List[Dict],
+        conn: sqlite3.Connection,
         table_name: str,
         max_samples: int = 5,
     ) -> Dict[str, Any]:
         """
-        Analyze detailed differences between rows in two datasets.
+        Analyze detailed differences between the rows of a table in two databases.
+
+        Rows are matched by the text form of their values, so the set
+        differences run inside SQLite and only the sample rows are fetched,
+        instead of loading both tables into Python. When every column holds
+        a single storage type, the same one in both tables, the text forms
+        match exactly when the values do, so the raw values are compared
+        with ``EXCEPT`` and only the samples are turned into text. Otherwise
+        each table's text forms are computed once and grouped together.
 
         Args:
-            data1: Data from database 1
-            data2: Data from database 2
+            conn: Connection to database 1 with database 2 attached as ``db2``
             table_name: Name of the table being compared
             max_samples: Maximum number of sample differences to show
 
@@ -836,39 +1600,93 @@ class SQLiteComparator:
             "sample_rows_db1_only": [],
             "sample_rows_db2_only": [],
             "is_type_only_difference": False,
+            "columns_db1": [],
+            "columns_db2": [],
         }
 
-        if not data1 or not data2:
+        # Check both tables have rows and get their column names in one query
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            f"""
+            SELECT 0, EXISTS (SELECT 1 FROM main.[{table_name}])
+                AND EXISTS (SELECT 1 FROM db2.[{table_name}])
+            UNION ALL
+            SELECT 1, name FROM pragma_table_info(?, 'main')
+            UNION ALL
+            SELECT 2, name FROM pragma_table_info(?, 'db2')
+        """,
+            (table_name, table_name),
+        )
+        meta = cursor.fetchall()
+        columns = [name for side, name in meta if side == 1]
+        columns_db2 = [name for side, name in meta if side == 2]
+        analysis["columns_db1"] = columns
+        analysis["columns_db2"] = columns_db2
+        if not meta[0][1]:
             return analysis
 
-        # Get column names
-        columns = list(data1[0].keys()) if data1 else []
-
-        # Create lookup dictionaries with string keys for matching
-        def create_lookup_key(row: Dict) -> str:
-            """Create a string key from row values for matching."""
-            return "|".join(str(v) if v is not None else "NULL" for v in row.values())
-
-        # Map rows by their string representation
-        data1_by_key = {create_lookup_key(row): row for row in data1}
-        data2_by_key = {create_lookup_key(row): row for row in data2}
-
-        # Find rows that match by value but might have type differences
-        type_mismatch_count = 0
+        keys1 = ", ".join(self.text_key_column_sql(col) for col in columns)
+        keys2 = ", ".join(self.text_key_column_sql(col) for col in columns_db2)
+
+        # Rows can only match when both tables have the same number of columns
+        comparable = len(columns) == len(columns_db2)
+
+        same_types = False
+        if comparable:
+            # Collect the storage types of each column, ignoring NULLs which
+            # only ever match NULLs, and stop at the first mixed column
+            types1 = ", ".join(f"typeof([{col}])" for col in columns)
+            types2 = ", ".join(f"typeof([{col}])" for col in columns_db2)
+            cursor.execute(
+                f"SELECT {types1} FROM main.[{table_name}] "
+                f"UNION SELECT {types2} FROM db2.[{table_name}]"
+            )
+            column_types = [set() for _ in columns]
+            same_types = True
+            for row_types in cursor:
+                for found, type_name in zip(column_types, row_types):
+                    if type_name != "null":
+                        found.add(type_name)
+                if any(len(found) > 1 for found in column_types):
+                    same_types = False
+                    break
+
+        # Values can only differ in type alone when some column mixes types
+        if comparable and not same_types:
+            # Take the first distinct rows of DB1 as samples for the type check
+            cursor.execute(f"SELECT {keys1}, * FROM main.[{table_name}]")
+            samples = {}
+            for row in cursor:
+                samples.setdefault(row[: len(columns)], row[len(columns) :])
+                if len(samples) == max_samples * 2:
+                    break
+
+            # Look up the DB2 rows with the same values
+            placeholders = ", ".join("?" * len(columns))
+            values = ", ".join([f"({placeholders})"] * len(samples))
+            cursor.execute(
+                f"SELECT {keys2}, * FROM db2.[{table_name}] "
+                f"WHERE ({keys2}) IN (VALUES {values})",
+                list(chain.from_iterable(samples)),
+            )
+            matches = {
+                row[: len(columns)]: dict(zip(columns_db2, row[len(columns) :]))
+                for row in cursor
+            }
 
-        for key1, row1 in list(data1_by_key.items())[: max_samples * 2]:
-            # Check if this row exists in DB2 with same string values
-            if key1 in data2_by_key:
-                row2 = data2_by_key[key1]
+            for key1, row1 in samples.items():
+                # Check if this row exists in DB2 with same string values
+                row2 = matches.get(key1)
+                if row2 is None:
+                    continue
 
                 # Check for type differences
-                for col in columns:
-                    val1 = row1.get(col)
+                for col, val1 in zip(columns, row1):
                     val2 = row2.get(col)
 
                     # Check if values are equal but types differ
                     if str(val1) == str(val2) and type(val1) != type(val2):  # noqa: E721
-                        type_mismatch_count += 1
                         if len(analysis["type_mismatches"]) < max_samples:
                             analysis["type_mismatches"].append(
                                 {
@@ -877,45 +1695,134 @@ class SQLiteComparator:
                                     "type_db1": type(val1).__name__,
                                     "type_db2": type(val2).__name__,
                                     "sample_row": {
-                                        k: str(v)[:50] for k, v in row1.items()
+                                        k: str(v)[:50] for k, v in zip(columns, row1)
                                     },
                                 }
                             )
 
-        # Find actual data mismatches (different values)
-        keys1_only = set(data1_by_key.keys()) - set(data2_by_key.keys())
-        keys2_only = set(data2_by_key.keys()) - set(data1_by_key.keys())
-
-        # Sample rows only in DB1
-        for key in list(keys1_only)[:max_samples]:
-            row = data1_by_key[key]
-            analysis["sample_rows_db1_only"].append(
-                {k: str(v)[:100] if v is not None else "NULL" for k, v in row.items()}
+        def sample_values_sql(count: int) -> str:
+            """Truncate sample values in SQL, mapping the NULL blob of the keys."""
+            return ", ".join(
+                f"CASE typeof(c{idx}) WHEN 'blob' THEN 'NULL' "
+                f"ELSE substr(c{idx}, 1, :width) END"
+                for idx in range(count)
             )
 
-        # Sample rows only in DB2
-        for key in list(keys2_only)[:max_samples]:
-            row = data2_by_key[key]
-            analysis["sample_rows_db2_only"].append(
-                {k: str(v)[:100] if v is not None else "NULL" for k, v in row.items()}
+        aliased1 = ", ".join(
+            f"{self.text_key_column_sql(col)} AS c{idx}"
+            for idx, col in enumerate(columns)
+        )
+        aliased2 = ", ".join(
+            f"{self.text_key_column_sql(col)} AS c{idx}"
+            for idx, col in enumerate(columns_db2)
+        )
+        params = {"limit": max_samples, "width": 100}
+
+        # Find actual data mismatches (different values) as sample rows,
+        # fetching both directions of the difference in a single query
+        if same_types:
+            as_text = ", ".join(
+                f"{self.text_key_column_sql(f'c{idx}')} AS c{idx}"
+                for idx in range(len(columns))
+            )
+            raw1 = ", ".join(
+                f"[{col}] COLLATE BINARY AS c{idx}" for idx, col in enumerate(columns)
+            )
+            raw2 = ", ".join(
+                f"[{col}] COLLATE BINARY AS c{idx}"
+                for idx, col in enumerate(columns_db2)
+            )
+            cursor.execute(
+                f"""
+                SELECT side, {sample_values_sql(len(columns))} FROM (
+                    SELECT side, {as_text} FROM (
+                        SELECT * FROM (
+                            SELECT 1 AS side, {raw1} FROM main.[{table_name}]
+                            EXCEPT SELECT 1, {raw2} FROM db2.[{table_name}]
+                            LIMIT :limit
+                        )
+                        UNION ALL
+                        SELECT * FROM (
+                            SELECT 2 AS side, {raw2} FROM db2.[{table_name}]
+                            EXCEPT SELECT 2, {raw1} FROM main.[{table_name}]
+                            LIMIT :limit
+                        )
+                    )
+                )
+            """,
+                params,
             )
+            sample_rows = cursor.fetchall()
+        elif comparable:
+            # Rows whose text forms occur in one table only, per side
+            group_by = ", ".join(f"c{idx}" for idx in range(len(columns)))
+            cursor.execute(
+                f"""
+                SELECT side, {sample_values_sql(len(columns))} FROM (
+                    SELECT MIN(side) AS side, {group_by},
+                        ROW_NUMBER() OVER (PARTITION BY MIN(side)) AS n
+                    FROM (
+                        SELECT 1 AS side, {aliased1} FROM main.[{table_name}]
+                        UNION ALL
+                        SELECT 2 AS side, {aliased2} FROM db2.[{table_name}]
+                    )
+                    GROUP BY {group_by}
+                    HAVING MIN(side) = MAX(side)
+                )
+                WHERE n <= :limit
+            """,
+                params,
+            )
+            sample_rows = cursor.fetchall()
+        else:
+            sample_rows = []
+            for side, schema, aliased, count in (
+                (1, "main", aliased1, len(columns)),
+                (2, "db2", aliased2, len(columns_db2)),
+            ):
+                cursor.execute(
+                    f"SELECT side, {sample_values_sql(count)} FROM ("
+                    f"SELECT DISTINCT {side} AS side, {aliased} "
+                    f"FROM {schema}.[{table_name}] LIMIT :limit)",
+                    params,
+                )
+                sample_rows.extend(cursor)
+
+        for side, *values in sample_rows:
+            if side == 1:
+                analysis["sample_rows_db1_only"].append(dict(zip(columns, values)))
+            else:
+                analysis["sample_rows_db2_only"].append(dict(zip(columns_db2, values)))
 
         # Determine if differences are type-only
         analysis["is_type_only_difference"] = (
             len(analysis["type_mismatches"]) > 0
-            and len(keys1_only) == 0
-            and len(keys2_only) == 0
+            and not analysis["sample_rows_db1_only"]
+            and not analysis["sample_rows_db2_only"]
         )
 
         return analysis
 
-    def display_detailed_differences_old(self, comparison: DatabaseComparison):
+    def display_detailed_differences(
+        self,
+        comparison: DatabaseComparison,
+        layout: Literal["stacked", "side_by_side"] = "side_by_side",
+    ):
         """
         Display detailed row-level differences for tables with mismatches.
 
         Args:
             comparison: DatabaseComparison object with results
+            layout: How sample rows are shown: ``side_by_side`` pairs up to
+                10 rows only in DB1 with rows only in DB2, ``stacked`` lists
+                up to 5 rows of each database separately
+
+        Raises:
+            ValueError: If the layout is unknown
         """
+        if layout not in ("stacked", "side_by_side"):
+            raise ValueError(f"Unknown layout: {layout!r}")
+
         non_identical_tables = [
             name
             for name, comp in comparison.table_comparisons.items()
@@ -925,391 +1832,398 @@ class SQLiteComparator:
         if not non_identical_tables:
             return
 
+        title = "🔍 Detailed Difference Analysis"
+        if layout == "side_by_side":
+            title += " - Side by Side Comparison"
         self.console.print("\n")
-        self.console.print(
-            Panel("🔍 Detailed Difference Analysis", style="bold cyan", box=box.DOUBLE)
-        )
+        self.console.print(Panel(title, style="bold cyan", box=box.DOUBLE))
 
-        with (
-            self.get_connection(self.db1_path) as conn1,
-            self.get_connection(self.db2_path) as conn2,
-        ):
-            for table_name in sorted(non_identical_tables):
-                table_comp = comparison.table_comparisons[table_name]
+        # Analyze tables concurrently and print each report in table order,
+        # as the console must only be used from this thread
+        tables = [
+            comparison.table_comparisons[name] for name in sorted(non_identical_tables)
+        ]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for renderables in executor.map(
+                    self._detailed_difference_renderables, tables, repeat(layout)
+                ):
+                    self.console.print(Group(*renderables))
+        finally:
+            self._close_worker_connections()
+
+    def _detailed_difference_renderables(
+        self, table_comp: TableComparison, layout: str
+    ) -> List[Any]:
+        """
+        Build the detailed difference report of one table.
 
-                self.console.print(f"\n[bold yellow]{'=' * 80}[/bold yellow]")
-                self.console.print(f"[bold cyan]Table: {table_name}[/bold cyan]")
-                self.console.print(f"[bold yellow]{'=' * 80}[/bold yellow]\n")
+        Runs on a worker thread, so the report is returned as renderables
+        instead of being printed.
 
-                # Get data for detailed analysis
-                data1 = self.get_table_data(conn1, table_name)
-                data2 = self.get_table_data(conn2, table_name)
+        Args:
+            table_comp: Comparison results for the table
+            layout: Sample row layout, see ``display_detailed_differences``
 
-                # Analyze differences
-                analysis = self.analyze_row_differences(data1, data2, table_name)
+        Returns:
+            List[Any]: Renderables making up the report, in display order
+        """
+        table_name = table_comp.table_name
+        renderables: List[Any] = []
+
+        renderables.append(f"\n[bold yellow]{'=' * 100}[/bold yellow]")
+        renderables.append(f"[bold cyan]📋 Table: {table_name}[/bold cyan]")
+        renderables.append(f"[bold yellow]{'=' * 100}[/bold yellow]\n")
+
+        # Analyze differences on this worker thread's connections. Tables that
+        # only differ in schema are first checked for identical rows, which
+        # stops at the first differing batch, before sampling differences
+        conn, conn2 = self._thread_connections()
+        is_schema_only_difference = (
+            not table_comp.schema_match
+            and table_comp.row_count_db1 == table_comp.row_count_db2
+            and self.tables_match_in_order(conn, conn2, table_name)
+        )
+        if is_schema_only_difference:
+            analysis = {
+                "type_mismatches": [],
+                "sample_rows_db1_only": [],
+                "sample_rows_db2_only": [],
+                "is_type_only_difference": False,
+            }
+        else:
+            analysis = self.analyze_row_differences(
+                conn, table_name, max_samples=5 if layout == "stacked" else 10
+            )
 
-                # Display type mismatches (WARNING - Yellow)
-                if analysis["type_mismatches"]:
-                    type_panel = Panel(
-                        "[bold yellow]⚠ DATA TYPE DIFFERENCES DETECTED[/bold yellow]\n"
-                        "[yellow]Values are identical but stored as different data types[/yellow]",
-                        style="yellow",
-                        box=box.ROUNDED,
-                        title="Type Mismatch Warning",
-                    )
-                    self.console.print(type_panel)
+        # Display type mismatches (WARNING - Yellow)
+        if analysis["type_mismatches"]:
+            type_panel = Panel(
+                "[bold yellow]⚠ DATA TYPE DIFFERENCES DETECTED[/bold yellow]\n"
+                "[yellow]Values are identical but stored as different data types[/yellow]",
+                style="yellow",
+                box=box.ROUNDED,
+                title="Type Mismatch Warning",
+            )
+            renderables.append(type_panel)
+
+            type_title = "Data Type Mismatches"
+            if layout == "side_by_side":
+                type_title += " - Side by Side"
+            type_table = Table(
+                title=type_title,
+                box=box.HEAVY_HEAD,
+                border_style="yellow",
+            )
+            type_table.add_column("Column", style="bold yellow", width=20)
+            type_table.add_column("Sample Value", style="white", width=30)
+            type_table.add_column(
+                "DB1 Type", style="cyan", justify="center", width=15
+            )
+            type_table.add_column(
+                "DB2 Type", style="magenta", justify="center", width=15
+            )
+            type_table.add_column(
+                "Match?", style="yellow", justify="center", width=10
+            )
 
-                    type_table = Table(
-                        title="Data Type Mismatches",
-                        box=box.SIMPLE_HEAD,
-                        border_style="yellow",
-                    )
-                    type_table.add_column("Column", style="bold yellow")
-                    type_table.add_column("Sample Value", style="white")
-                    type_table.add_column("Type in DB1", style="cyan")
-                    type_table.add_column("Type in DB2", style="magenta")
-
-                    for mismatch in analysis["type_mismatches"]:
-                        type_table.add_row(
-                            mismatch["column"],
-                            mismatch["value"][:50],
-                            mismatch["type_db1"],
-                            mismatch["type_db2"],
-                        )
+            # Styles come from the columns; Text cells skip markup parsing
+            for mismatch in analysis["type_mismatches"]:
+                type_table.add_row(
+                    Text(mismatch["column"]),
+                    Text(
+                        mismatch["value"][:30] + "..."
+                        if len(mismatch["value"]) > 30
+                        else mismatch["value"]
+                    ),
+                    Text(mismatch["type_db1"]),
+                    Text(mismatch["type_db2"]),
+                    Text("Type ≠"),
+                )
 
-                    self.console.print(type_table)
-                    self.console.print()
-
-                # Display actual data differences (ERROR - Red)
-                if analysis["sample_rows_db1_only"] or analysis["sample_rows_db2_only"]:
-                    if not analysis["is_type_only_difference"]:
-                        data_panel = Panel(
-                            "[bold red]✗ ACTUAL DATA DIFFERENCES DETECTED[/bold red]\n"
-                            "[red]Rows exist in one database but not the other[/red]",
-                            style="red",
-                            box=box.ROUNDED,
-                            title="Data Mismatch Error",
-                        )
-                        self.console.print(data_panel)
-
-                    # Rows only in DB1
-                    if analysis["sample_rows_db1_only"]:
-                        self.console.print(
-                            f"\n[bold red]Sample rows ONLY in DB1:[/bold red] "
-                            f"(Showing {len(analysis['sample_rows_db1_only'])} of "
-                            f"{table_comp.data_differences.get('rows_only_in_db1', 0)})"
-                        )
+            renderables.append(type_table)
+            renderables.append("")
+
+        # Display sample rows of actual data differences
+        if analysis["sample_rows_db1_only"] or analysis["sample_rows_db2_only"]:
+            if not analysis["is_type_only_difference"]:
+                data_panel = Panel(
+                    "[bold red]✗ ACTUAL DATA DIFFERENCES DETECTED[/bold red]\n"
+                    "[red]Rows exist in one database but not the other[/red]",
+                    style="red",
+                    box=box.ROUNDED,
+                    title="Data Mismatch Error",
+                )
+                renderables.append(data_panel)
+
+            if layout == "side_by_side":
+                renderables.extend(self._render_samples_side_by_side(analysis))
+            else:
+                renderables.extend(self._render_samples_stacked(analysis, table_comp))
+
+        # Summary for this table
+        summary_table = Table(
+            title=f"Summary for {table_name}",
+            box=box.DOUBLE_EDGE,
+            show_header=True,
+        )
+        summary_table.add_column("Metric", style="bold")
+        summary_table.add_column("Count", justify="right")
 
-                        for idx, row in enumerate(analysis["sample_rows_db1_only"], 1):
-                            row_table = Table(
-                                title=f"Row #{idx}",
-                                box=box.SIMPLE,
-                                border_style="red",
-                                show_header=True,
-                            )
-                            row_table.add_column("Column", style="bold")
-                            row_table.add_column("Value", style="white")
+        summary_table.add_row(
+            "Total Rows in DB1", f"[cyan]{table_comp.row_count_db1}[/cyan]"
+        )
+        summary_table.add_row(
+            "Total Rows in DB2",
+            f"[magenta]{table_comp.row_count_db2}[/magenta]",
+        )
 
-                            for col, val in row.items():
-                                row_table.add_row(col, val)
+        if table_comp.data_differences:
+            diff_data = table_comp.data_differences
 
-                            self.console.print(row_table)
+            if diff_data.get("identical_rows", 0) > 0:
+                summary_table.add_row(
+                    "Identical Rows",
+                    f"[green]{diff_data['identical_rows']}[/green]",
+                )
 
-                    # Rows only in DB2
-                    if analysis["sample_rows_db2_only"]:
-                        self.console.print(
-                            f"\n[bold red]Sample rows ONLY in DB2:[/bold red] "
-                            f"(Showing {len(analysis['sample_rows_db2_only'])} of "
-                            f"{table_comp.data_differences.get('rows_only_in_db2', 0)})"
-                        )
+            if diff_data.get("rows_only_in_db1", 0) > 0:
+                summary_table.add_row(
+                    "Rows Only in DB1",
+                    f"[red]{diff_data['rows_only_in_db1']}[/red]",
+                )
 
-                        for idx, row in enumerate(analysis["sample_rows_db2_only"], 1):
-                            row_table = Table(
-                                title=f"Row #{idx}",
-                                box=box.SIMPLE,
-                                border_style="red",
-                                show_header=True,
-                            )
-                            row_table.add_column("Column", style="bold")
-                            row_table.add_column("Value", style="white")
+            if diff_data.get("rows_only_in_db2", 0) > 0:
+                summary_table.add_row(
+                    "Rows Only in DB2",
+                    f"[red]{diff_data['rows_only_in_db2']}[/red]",
+                )
 
-                            for col, val in row.items():
-                                row_table.add_row(col, val)
+        renderables.append(summary_table)
 
-                            self.console.print(row_table)
+        # Conclusion for this table
+        if is_schema_only_difference:
+            conclusion_text = (
+                "[bold yellow]✓ CONCLUSION:[/bold yellow] "
+                "[yellow]All rows are identical. "
+                "Differences are only in the table schema.[/yellow]"
+            )
+            conclusion_style = "yellow"
+        elif analysis["is_type_only_difference"]:
+            conclusion_text = (
+                "[bold yellow]✓ CONCLUSION:[/bold yellow] "
+                "[yellow]All data values are identical. "
+                "Differences are only in data types (e.g., string vs integer).[/yellow]"
+            )
+            conclusion_style = "yellow"
+        else:
+            conclusion_text = (
+                "[bold red]✗ CONCLUSION:[/bold red] "
+                "[red]Actual data differences exist beyond just data types.[/red]"
+            )
+            conclusion_style = "red"
 
-                # Summary for this table
-                if analysis["is_type_only_difference"]:
-                    summary_text = (
-                        "[bold yellow]✓ CONCLUSION:[/bold yellow] "
-                        "[yellow]All data values are identical. "
-                        "Differences are only in data types (e.g., string vs integer).[/yellow]"
-                    )
-                else:
-                    summary_text = (
-                        "[bold red]✗ CONCLUSION:[/bold red] "
-                        "[red]Actual data differences exist beyond just data types.[/red]"
-                    )
+        renderables.append(
+            Panel(conclusion_text, box=box.ROUNDED, style=conclusion_style)
+        )
+        renderables.append("")
 
-                self.console.print(Panel(summary_text, box=box.ROUNDED))
+        return renderables
 
-    def display_detailed_differences(self, comparison: DatabaseComparison):
+    def _render_samples_side_by_side(self, analysis: Dict[str, Any]) -> List[Any]:
         """
-        Display detailed row-level differences for tables with mismatches.
+        Render sample rows as pairs of a row only in DB1 and a row only in DB2.
 
         Args:
-            comparison: DatabaseComparison object with results
+            analysis: Result of ``analyze_row_differences``
+
+        Returns:
+            List[Any]: Renderables showing the sample rows
         """
-        non_identical_tables = [
-            name
-            for name, comp in comparison.table_comparisons.items()
-            if not comp.is_identical
+        # Get all columns for side-by-side comparison, in table order
+        all_columns = analysis["columns_db1"] + [
+            col
+            for col in analysis["columns_db2"]
+            if col not in analysis["columns_db1"]
         ]
 
-        if not non_identical_tables:
-            return
+        # Display side-by-side comparison
+        max_rows = max(
+            len(analysis["sample_rows_db1_only"]),
+            len(analysis["sample_rows_db2_only"]),
+        )
 
-        self.console.print("\n")
-        self.console.print(
-            Panel(
-                "🔍 Detailed Difference Analysis - Side by Side Comparison",
-                style="bold cyan",
-                box=box.DOUBLE,
+        renderables: List[Any] = []
+        if max_rows > 0:
+            renderables.append(
+                "\n[bold white]Side-by-Side Row Comparison:[/bold white]"
+            )
+            renderables.append(
+                f"[dim]Showing up to {max_rows} sample rows[/dim]\n"
             )
-        )
 
-        with (
-            self.get_connection(self.db1_path) as conn1,
-            self.get_connection(self.db2_path) as conn2,
-        ):
-            for table_name in sorted(non_identical_tables):
-                table_comp = comparison.table_comparisons[table_name]
+            # One table for all row pairs, so Rich measures it once
+            comparison_table = Table(
+                title="Row Comparison",
+                box=box.HEAVY_EDGE,
+                show_header=True,
+                border_style="red",
+            )
 
-                self.console.print(f"\n[bold yellow]{'=' * 100}[/bold yellow]")
-                self.console.print(f"[bold cyan]📋 Table: {table_name}[/bold cyan]")
-                self.console.print(f"[bold yellow]{'=' * 100}[/bold yellow]\n")
+            comparison_table.add_column(
+                "Row #", style="bold", justify="right", width=5
+            )
+            comparison_table.add_column(
+                "Column", style="bold white", width=25
+            )
+            comparison_table.add_column(
+                "DB1 Value", style="cyan", width=35
+            )
+            comparison_table.add_column(
+                "DB2 Value", style="magenta", width=35
+            )
+            comparison_table.add_column(
+                "Status", justify="center", width=10
+            )
 
-                # Get data for detailed analysis
-                data1 = self.get_table_data(conn1, table_name)
-                data2 = self.get_table_data(conn2, table_name)
+            def shorten(value: str) -> str:
+                """Truncate long values to fit the value columns."""
+                return value if len(value) <= 35 else value[:32] + "..."
 
-                # Analyze differences
-                analysis = self.analyze_row_differences(
-                    data1, data2, table_name, max_samples=10
+            for idx in range(max_rows):
+                # Get rows from both databases
+                row_db1 = (
+                    analysis["sample_rows_db1_only"][idx]
+                    if idx < len(analysis["sample_rows_db1_only"])
+                    else {}
+                )
+                row_db2 = (
+                    analysis["sample_rows_db2_only"][idx]
+                    if idx < len(analysis["sample_rows_db2_only"])
+                    else {}
                 )
 
-                # Display type mismatches (WARNING - Yellow)
-                if analysis["type_mismatches"]:
-                    type_panel = Panel(
-                        "[bold yellow]⚠ DATA TYPE DIFFERENCES DETECTED[/bold yellow]\n"
-                        "[yellow]Values are identical but stored as different data types[/yellow]",
-                        style="yellow",
-                        box=box.ROUNDED,
-                        title="Type Mismatch Warning",
-                    )
-                    self.console.print(type_panel)
-
-                    type_table = Table(
-                        title="Data Type Mismatches - Side by Side",
-                        box=box.HEAVY_HEAD,
-                        border_style="yellow",
-                    )
-                    type_table.add_column("Column", style="bold yellow", width=20)
-                    type_table.add_column("Sample Value", style="white", width=30)
-                    type_table.add_column(
-                        "DB1 Type", style="cyan", justify="center", width=15
-                    )
-                    type_table.add_column(
-                        "DB2 Type", style="magenta", justify="center", width=15
-                    )
-                    type_table.add_column("Match?", justify="center", width=10)
-
-                    for mismatch in analysis["type_mismatches"]:
-                        type_table.add_row(
-                            mismatch["column"],
-                            mismatch["value"][:30] + "..."
-                            if len(mismatch["value"]) > 30
-                            else mismatch["value"],
-                            f"[cyan]{mismatch['type_db1']}[/cyan]",
-                            f"[magenta]{mismatch['type_db2']}[/magenta]",
-                            "[yellow]Type ≠[/yellow]",
-                        )
-
-                    self.console.print(type_table)
-                    self.console.print()
-
-                # Display side-by-side row comparisons
-                if analysis["sample_rows_db1_only"] or analysis["sample_rows_db2_only"]:
-                    if not analysis["is_type_only_difference"]:
-                        data_panel = Panel(
-                            "[bold red]✗ ACTUAL DATA DIFFERENCES DETECTED[/bold red]\n"
-                            "[red]Rows exist in one database but not the other[/red]",
-                            style="red",
-                            box=box.ROUNDED,
-                            title="Data Mismatch Error",
-                        )
-                        self.console.print(data_panel)
-
-                    # Get all columns for side-by-side comparison
-                    all_columns = set()
-                    for row in (
-                        analysis["sample_rows_db1_only"]
-                        + analysis["sample_rows_db2_only"]
-                    ):
-                        all_columns.update(row.keys())
-                    all_columns = sorted(all_columns)
-
-                    # Display side-by-side comparison
-                    max_rows = max(
-                        len(analysis["sample_rows_db1_only"]),
-                        len(analysis["sample_rows_db2_only"]),
+                # Compare each column; cells are Text objects so
+                # values are never parsed as console markup. Sample values
+                # are always strings, so None marks a missing row or column
+                for col_idx, col in enumerate(all_columns):
+                    val_db1 = row_db1.get(col)
+                    val_db2 = row_db2.get(col)
+
+                    # Determine status
+                    if val_db1 is None and val_db2 is None:
+                        # Neither sample row has this column
+                        status = Text("—", style="dim")
+                        val_db1_display = Text("<missing>", style="red dim")
+                        val_db2_display = Text("<missing>", style="red dim")
+                    elif val_db1 is None:
+                        status = Text("DB1 ✗", style="red")
+                        val_db1_display = Text("<missing>", style="red dim")
+                        val_db2_display = Text(shorten(val_db2), style="green")
+                    elif val_db2 is None:
+                        status = Text("DB2 ✗", style="red")
+                        val_db1_display = Text(shorten(val_db1), style="green")
+                        val_db2_display = Text("<missing>", style="red dim")
+                    else:
+                        val_db1 = shorten(val_db1)
+                        val_db2 = shorten(val_db2)
+                        if val_db1 == val_db2:
+                            status = Text("✓", style="green")
+                            val_db1_display = Text(val_db1)
+                            val_db2_display = Text(val_db2)
+                        else:
+                            status = Text("≠", style="red")
+                            val_db1_display = Text(val_db1, style="yellow")
+                            val_db2_display = Text(val_db2, style="yellow")
+
+                    comparison_table.add_row(
+                        str(idx + 1) if col_idx == 0 else "",
+                        Text(col),
+                        val_db1_display,
+                        val_db2_display,
+                        status,
+                        end_section=col_idx == len(all_columns) - 1,
                     )
 
-                    if max_rows > 0:
-                        self.console.print(
-                            "\n[bold white]Side-by-Side Row Comparison:[/bold white]"
-                        )
-                        self.console.print(
-                            f"[dim]Showing up to {max_rows} sample rows[/dim]\n"
-                        )
+            renderables.append(comparison_table)
+            renderables.append("")
 
-                        for idx in range(max_rows):
-                            # Create side-by-side table for each row pair
-                            comparison_table = Table(
-                                title=f"Row Comparison #{idx + 1}",
-                                box=box.HEAVY_EDGE,
-                                show_header=True,
-                                border_style="red",
-                            )
-
-                            comparison_table.add_column(
-                                "Column", style="bold white", width=25
-                            )
-                            comparison_table.add_column(
-                                "DB1 Value", style="cyan", width=35
-                            )
-                            comparison_table.add_column(
-                                "DB2 Value", style="magenta", width=35
-                            )
-                            comparison_table.add_column(
-                                "Status", justify="center", width=10
-                            )
+        return renderables
 
-                            # Get rows from both databases
-                            row_db1 = (
-                                analysis["sample_rows_db1_only"][idx]
-                                if idx < len(analysis["sample_rows_db1_only"])
-                                else {}
-                            )
-                            row_db2 = (
-                                analysis["sample_rows_db2_only"][idx]
-                                if idx < len(analysis["sample_rows_db2_only"])
-                                else {}
-                            )
-
-                            # Compare each column
-                            for col in all_columns:
-                                val_db1 = row_db1.get(col, "[dim]<missing>[/dim]")
-                                val_db2 = row_db2.get(col, "[dim]<missing>[/dim]")
-
-                                # Truncate long values
-                                if isinstance(val_db1, str) and len(val_db1) > 35:
-                                    val_db1 = val_db1[:32] + "..."
-                                if isinstance(val_db2, str) and len(val_db2) > 35:
-                                    val_db2 = val_db2[:32] + "..."
-
-                                # Determine status
-                                if val_db1 == "[dim]<missing>[/dim]":
-                                    status = "[red]DB1 ✗[/red]"
-                                    val_db1_display = "[red]" + val_db1 + "[/red]"
-                                    val_db2_display = (
-                                        "[green]" + str(val_db2) + "[/green]"
-                                    )
-                                elif val_db2 == "[dim]<missing>[/dim]":
-                                    status = "[red]DB2 ✗[/red]"
-                                    val_db1_display = (
-                                        "[green]" + str(val_db1) + "[/green]"
-                                    )
-                                    val_db2_display = "[red]" + val_db2 + "[/red]"
-                                elif str(val_db1) == str(val_db2):
-                                    status = "[green]✓[/green]"
-                                    val_db1_display = str(val_db1)
-                                    val_db2_display = str(val_db2)
-                                else:
-                                    status = "[red]≠[/red]"
-                                    val_db1_display = (
-                                        "[yellow]" + str(val_db1) + "[/yellow]"
-                                    )
-                                    val_db2_display = (
-                                        "[yellow]" + str(val_db2) + "[/yellow]"
-                                    )
-
-                                comparison_table.add_row(
-                                    col, val_db1_display, val_db2_display, status
-                                )
-
-                            self.console.print(comparison_table)
-                            self.console.print()
-
-                # Summary for this table
-                summary_table = Table(
-                    title=f"Summary for {table_name}",
-                    box=box.DOUBLE_EDGE,
-                    show_header=True,
-                )
-                summary_table.add_column("Metric", style="bold")
-                summary_table.add_column("Count", justify="right")
+    def _render_samples_stacked(
+        self, analysis: Dict[str, Any], table_comp: TableComparison
+    ) -> List[Any]:
+        """
+        Render the sample rows only in DB1, then those only in DB2.
 
-                summary_table.add_row(
-                    "Total Rows in DB1", f"[cyan]{table_comp.row_count_db1}[/cyan]"
-                )
-                summary_table.add_row(
-                    "Total Rows in DB2",
-                    f"[magenta]{table_comp.row_count_db2}[/magenta]",
-                )
+        Args:
+            analysis: Result of ``analyze_row_differences``
+            table_comp: Comparison results for the table
 
-                if table_comp.data_differences:
-                    diff_data = table_comp.data_differences
+        Returns:
+            List[Any]: Renderables showing the sample rows
+        """
+        renderables: List[Any] = []
+        for label, sample_key, count_key in (
+            ("DB1", "sample_rows_db1_only", "rows_only_in_db1"),
+            ("DB2", "sample_rows_db2_only", "rows_only_in_db2"),
+        ):
+            samples = analysis[sample_key]
+            if not samples:
+                continue
+
+            renderables.append(
+                f"\n[bold red]Sample rows ONLY in {label}:[/bold red] "
+                f"(Showing {len(samples)} of "
+                f"{table_comp.data_differences.get(count_key, 0)})"
+            )
 
-                    if diff_data.get("identical_rows", 0) > 0:
-                        summary_table.add_row(
-                            "Identical Rows",
-                            f"[green]{diff_data['identical_rows']}[/green]",
-                        )
+            # One table per database, with a section per sample row
+            rows_table = Table(box=box.SIMPLE, border_style="red", show_header=True)
+            rows_table.add_column("Row #", style="bold", justify="right")
+            rows_table.add_column("Column", style="bold")
+            rows_table.add_column("Value", style="white")
+
+            for idx, row in enumerate(samples, 1):
+                for col_idx, (col, val) in enumerate(row.items()):
+                    rows_table.add_row(
+                        str(idx) if col_idx == 0 else "",
+                        Text(col),
+                        Text(val),
+                        end_section=col_idx == len(row) - 1,
+                    )
 
-                    if diff_data.get("rows_only_in_db1", 0) > 0:
-                        summary_table.add_row(
-                            "Rows Only in DB1",
-                            f"[red]{diff_data['rows_only_in_db1']}[/red]",
-                        )
+            renderables.append(rows_table)
 
-                    if diff_data.get("rows_only_in_db2", 0) > 0:
-                        summary_table.add_row(
-                            "Rows Only in DB2",
-                            f"[red]{diff_data['rows_only_in_db2']}[/red]",
-                        )
+        return renderables
 
-                self.console.print(summary_table)
+    def export_report(self, comparison: DatabaseComparison, path: str):
+        """
+        Write the comparison results and detailed differences to a file.
 
-                # Conclusion for this table
-                if analysis["is_type_only_difference"]:
-                    conclusion_text = (
-                        "[bold yellow]✓ CONCLUSION:[/bold yellow] "
-                        "[yellow]All data values are identical. "
-                        "Differences are only in data types (e.g., string vs integer).[/yellow]"
-                    )
-                    conclusion_style = "yellow"
-                else:
-                    conclusion_text = (
-                        "[bold red]✗ CONCLUSION:[/bold red] "
-                        "[red]Actual data differences exist beyond just data types.[/red]"
-                    )
-                    conclusion_style = "red"
+        The report is rendered on its own console, so nothing is drawn on
+        the terminal. Paths ending in ``.html`` or ``.htm`` get an HTML
+        report, anything else plain text.
 
-                self.console.print(
-                    Panel(conclusion_text, box=box.ROUNDED, style=conclusion_style)
-                )
-                self.console.print()
+        Args:
+            comparison: DatabaseComparison object with results
+            path: Path of the report file
+        """
+        as_html = Path(path).suffix.lower() in (".html", ".htm")
+        terminal_console = self.console
+
+        with open(path, "w", encoding="utf-8") as report:
+            self.console = Console(
+                file=io.StringIO() if as_html else report,
+                width=200,
+                record=as_html,
+            )
+            try:
+                self.display_results(comparison)
+                if as_html:
+                    report.write(self.console.export_html())
+            finally:
+                self.console = terminal_console
 
     # --------- Additional helper methods for future enhancements (e.g., export results, generate reports, etc.) can be added here ---------
 
@@ -1317,6 +2231,16 @@ class SQLiteComparator:
 def main():
     """Main function to run the database comparison."""
 
+    parser = argparse.ArgumentParser(description="Compare two SQLite databases.")
+    parser.add_argument("db1", nargs="?", help="Path to database 1")
+    parser.add_argument("db2", nargs="?", help="Path to database 2")
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write the results to PATH (.html or plain text) instead of the terminal",
+    )
+    args = parser.parse_args()
+
     console = Console()
 
     # Get database paths from user
@@ -1324,9 +2248,9 @@ def main():
         Panel("SQLite Database Comparator", style="bold blue", box=box.DOUBLE)
     )
 
-    if len(sys.argv) == 3:
-        db1_path = sys.argv[1]
-        db2_path = sys.argv[2]
+    if args.db1 and args.db2:
+        db1_path = args.db1
+        db2_path = args.db2
     else:
         # Create a hidden tkinter root window
         root = tk.Tk()
@@ -1382,6 +2306,12 @@ def main():
         # Create comparator and run comparison
         comparator = SQLiteComparator(db1_path, db2_path)
 
+        if args.report:
+            comparison_result = comparator.compare_databases()
+            comparator.export_report(comparison_result, args.report)
+            console.print(gen(f"✓ Report written to {args.report}", "green"))
+            return
+
         with console.status(gen("Comparing databases...", "bold green"), spinner="dots"):
             comparison_result = comparator.compare_databases()
 
@@ -1416,27 +2346,7 @@ def main():
                 columns = [col[1] for col in schema]
 
                 # Compute mismatched columns using PK as reference
-                pk_cols = [col[1] for col in schema if col[5] != 0]  # PK flag
-                if not pk_cols:
-                    pk_cols = [columns[0]] if columns else []
-
-                data1 = comparator.get_table_data(comparator.get_connection(comparator.db1_path), table_name)
-                data2 = comparator.get_table_data(comparator.get_connection(comparator.db2_path), table_name)
-
-                def make_key(row):
-                    return tuple(row.get(col) for col in pk_cols)
-
-                data1_map = {make_key(row): row for row in data1}
-                data2_map = {make_key(row): row for row in data2}
-
-                common_keys = set(data1_map) & set(data2_map)
-                mismatched_cols = set()
-                for key in common_keys:
-                    row1 = data1_map[key]
-                    row2 = data2_map[key]
-                    for col in columns:
-                        if row1.get(col) != row2.get(col):
-                            mismatched_cols.add(col)
+                mismatched_cols = comparator.get_mismatched_columns(table_name)
 
                 # List columns with color
                 console.print(gen("\nAvailable columns:", "bold white"))
@@ -0,0 +1,57 @@
+"""Detailed difference views must render every table they are given."""
+
+import io
+import sqlite3
+import sys
+from pathlib import Path
+
+from rich.console import Console
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db_comparator import SQLiteComparator  # noqa: E402
+
+
+def make_database(path: Path, schema: str, rows):
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"CREATE TABLE t ({schema})")
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            conn.executemany(f"INSERT INTO t VALUES ({placeholders})", rows)
+    conn.close()
+
+
+def make_comparator(tmp_path: Path) -> SQLiteComparator:
+    comparator = SQLiteComparator(str(tmp_path / "db1.db"), str(tmp_path / "db2.db"))
+    comparator.console = Console(file=io.StringIO(), width=200)
+    return comparator
+
+
+def test_schema_differences_with_uneven_sample_counts(tmp_path):
+    make_database(tmp_path / "db1.db", "id, x", [(i, f"x{i}") for i in range(3)])
+    make_database(
+        tmp_path / "db2.db", "id, y, z", [(i, f"y{i}", i) for i in range(12)]
+    )
+    comparator = make_comparator(tmp_path)
+
+    for layout in ("side_by_side", "stacked"):
+        comparator.display_detailed_differences(
+            comparator.compare_databases(), layout=layout
+        )
+
+    report = comparator.console.file.getvalue()
+    assert "<missing>" in report
+    assert "Summary for t" in report
+
+
+def test_rows_with_null_keys_are_matched(tmp_path):
+    make_database(tmp_path / "db1.db", "k, v", [(None, "x"), (1, "a")])
+    make_database(tmp_path / "db2.db", "k, v", [(None, "y"), (1, "a")])
+    comparator = make_comparator(tmp_path)
+
+    assert comparator.get_mismatched_columns("t") == {"v"}
+
+    comparator.detailed_table_comparison("t", ["v"])
+    report = comparator.console.file.getvalue()
+    assert "Found 1 mismatched rows" in report
+    assert "(None,)" in report
@@ -0,0 +1,61 @@
+"""The SQL comparison must normalize values exactly like the Python fallback."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db_comparator import SQLiteComparator  # noqa: E402
+
+WHITESPACE = "".join(
+    chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()
+)
+
+ROWS_DB1 = [(i, "x", 0.1 + 0.2) for i in range(200)] + [(200, "y", 1.0)]
+ROWS_DB2 = [
+    (i, WHITESPACE[i % len(WHITESPACE)] + "x" + WHITESPACE, 0.3) for i in range(200)
+] + [(200, "\xa0z　", 1.0)]
+
+COUNT_KEYS = ("rows_only_in_db1", "rows_only_in_db2", "identical_rows")
+
+
+def make_database(path: Path, schema: str, rows):
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"CREATE TABLE t ({schema})")
+        conn.executemany("INSERT INTO t VALUES (?, ?, ?)", rows)
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        "id INTEGER PRIMARY KEY, name TEXT, amount REAL",  # primary key join
+        "id INTEGER, name TEXT, amount REAL",  # GROUP BY scan
+    ],
+)
+def test_sql_and_python_comparisons_agree(tmp_path, schema):
+    make_database(tmp_path / "db1.db", schema, ROWS_DB1)
+    make_database(tmp_path / "db2.db", schema, ROWS_DB2)
+
+    comparator = SQLiteComparator(str(tmp_path / "db1.db"), str(tmp_path / "db2.db"))
+    conn1, conn2 = comparator.open_connection_pair()
+    try:
+        table_schema = comparator.get_table_schema(conn1, "t")
+        in_sql = comparator.compare_table_data_sql(
+            conn1, "t", table_schema, len(ROWS_DB1), len(ROWS_DB2)
+        )
+        in_python = comparator.compare_table_data(
+            comparator.iter_table_rows(conn1, "t"),
+            comparator.iter_table_rows(conn2, "t"),
+        )
+    finally:
+        conn1.close()
+        conn2.close()
+
+    assert {key: in_sql[key] for key in COUNT_KEYS} == {
+        key: in_python[key] for key in COUNT_KEYS
+    }
+    assert in_sql["rows_only_in_db1"] == in_sql["rows_only_in_db2"] == 1